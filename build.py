@@ -1,83 +1,456 @@
 #!/usr/bin/env python3
 """
 Build script for creating a standalone executable for the GUI application using PyInstaller.
+
+PyInstaller is run with bytecode optimization level 2 (``--optimize=2``, and
+``python -OO`` when run with --isolated), so assert statements and docstrings are
+stripped from every collected module. This needs PyInstaller 6.6 or newer.
+
+The generated spec file is kept in gui/build and reused while the build options
+are unchanged, so warm builds keep PyInstaller's cached analysis.
 """
 
 import os
 import sys
+import shutil
+import argparse
 import subprocess
+import hashlib
+import re
+import importlib.util
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor
+
+# Project-local pip cache so repeated builds reuse downloaded wheels
+PIP_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pip-cache")
+
+# Oldest PyInstaller release that supports --optimize
+PYINSTALLER_MIN_VERSION = (6, 6)
+
+# Packages needed by each build backend, as pip requirement -> import name
+BUILD_PACKAGES = {
+    "pyinstaller": {"pyinstaller>=6.6": "PyInstaller"},
+    "nuitka": {"nuitka": "nuitka", "ordered-set": "ordered_set"},
+}
+
+# Packages the GUI application always needs, as pip name -> import name
+CORE_PACKAGES = {
+    "pyyaml": "yaml",
+    "xlsxwriter": "xlsxwriter",
+}
+
+# Packages only needed by optional features (Parquet and Feather export, themes).
+# They are bundled if already installed, and only installed when
+# --with-optional is given
+OPTIONAL_PACKAGES = {
+    "pandas": "pandas",
+    "pyarrow": "pyarrow",
+    "ttkthemes": "ttkthemes",
+}
+
+# Marker recording the environment that last passed the dependency check
+ENV_MARKER = os.path.join("gui", "build", ".env.ok")
+
+def get_required_packages(backend, with_optional=False):
+    """
+    Get the packages that must be installed before building.
+    
+    Args:
+        backend (str): Name of the build backend
+        with_optional (bool): Whether to include the optional feature packages
+    
+    Returns:
+        dict: Mapping of pip package name to import name
+    """
+    packages = {**BUILD_PACKAGES[backend], **CORE_PACKAGES}
+    if with_optional:
+        packages.update(OPTIONAL_PACKAGES)
+    return packages
+
+def environment_key(packages):
+    """
+    Compute a key identifying the interpreter and the packages it must provide.
+    
+    Args:
+        packages (dict): Mapping of pip package name to import name
+    
+    Returns:
+        str: Hex digest that changes whenever the interpreter or package list changes
+    """
+    return hashlib.sha256((sys.version + sys.executable + repr(sorted(packages))).encode()).hexdigest()
+
+def environment_is_cached(key):
+    """Check whether the dependency check already passed for this environment."""
+    try:
+        with open(ENV_MARKER, 'r', encoding='utf-8') as f:
+            return f.read().strip() == key
+    except OSError:
+        return False
+
+def save_environment_key(key):
+    """Record that the dependency check passed for this environment."""
+    os.makedirs(os.path.dirname(ENV_MARKER), exist_ok=True)
+    with open(ENV_MARKER, 'w', encoding='utf-8') as f:
+        f.write(key)
+
+def is_installed(module_name):
+    """
+    Check whether a module can be imported, without importing it.
+    
+    importlib.util.find_spec only locates the module's loader, so none of the
+    package's top-level code (e.g. numpy/pandas initialization) is run.
+    
+    Args:
+        module_name (str): Import name of the module
+    
+    Returns:
+        bool: True if the module can be found, False otherwise
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        # Raised for dotted names whose parent package is missing, or for
+        # modules already in sys.modules without a spec
+        return False
 
-def check_pyinstaller():
-    """Check if PyInstaller is installed, and install it if not."""
+def find_missing_packages(packages):
+    """
+    Find which packages are not installed.
+    
+    Args:
+        packages (dict): Mapping of pip package name to import name
+    
+    Returns:
+        list: pip names of the packages that could not be found
+    """
+    # Probe all packages concurrently
+    with ThreadPoolExecutor(max_workers=len(packages)) as executor:
+        installed = executor.map(is_installed, packages.values())
+    
+    return [package for package, found in zip(packages, installed) if not found]
+
+def check_c_compiler():
+    """Warn if no C compiler is available for Nuitka."""
+    # Nuitka compiles to C, so a compiler is needed (on Windows Nuitka can download MinGW itself)
+    if sys.platform != "win32" and not any(shutil.which(cc) for cc in ("cc", "gcc", "clang")):
+        print("Warning: no C compiler found on PATH. Nuitka needs gcc or clang to build.")
+
+def check_dependencies(packages):
+    """Check if the build backend and all required dependencies are installed, and install any that are missing."""
+    missing = find_missing_packages(packages)
+    
+    if not missing:
+        print("All dependencies are already installed.")
+        return
+    
+    # Install everything in a single pip run so the resolver only starts once
+    print(f"Packages not found: {', '.join(missing)}. Installing...")
+    subprocess.check_call([
+        sys.executable, "-m", "pip", "install",
+        "--prefer-binary",  # Use a wheel when one exists rather than building an sdist
+        "--cache-dir", PIP_CACHE,
+        *missing
+    ])
+    print("Packages installed successfully.")
+
+# Newer pefile releases make PyInstaller's "binary vs data reclassification" step
+# on Windows take 20-30 minutes (reported on the PyInstaller issue tracker).
+# Remove this pin once a PyInstaller release no longer depends on the slow code path.
+PEFILE_PIN = "2023.2.7"
+
+def check_pefile_pin():
+    """On Windows, make sure the pinned pefile version is installed for PyInstaller."""
+    if sys.platform != "win32":
+        return
+    
+    try:
+        installed = importlib.metadata.version("pefile")
+    except importlib.metadata.PackageNotFoundError:
+        installed = None
+    
+    if installed == PEFILE_PIN:
+        return
+    
+    print(f"Installing pefile=={PEFILE_PIN} (found {installed or 'none'})...")
+    subprocess.check_call([
+        sys.executable, "-m", "pip", "install",
+        "--prefer-binary",
+        "--cache-dir", PIP_CACHE,
+        f"pefile=={PEFILE_PIN}"
+    ])
+
+def parse_version(version):
+    """Turn a version string such as "6.10.0rc1" into a tuple of its leading numbers."""
+    match = re.match(r"\d+(?:\.\d+)*", version)
+    return tuple(int(part) for part in match.group().split(".")) if match else ()
+
+def check_pyinstaller_version():
+    """Make sure the installed PyInstaller is new enough for --optimize."""
     try:
-        import PyInstaller
-        print("PyInstaller is already installed.")
-    except ImportError:
-        print("PyInstaller not found. Installing...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-        print("PyInstaller installed successfully.")
-
-def check_dependencies():
-    """Check if all required dependencies are installed."""
-    required_packages = [
-        "pandas",
-        "openpyxl",
-        "pyyaml",
-        "ttkthemes"
+        installed = importlib.metadata.version("pyinstaller")
+    except importlib.metadata.PackageNotFoundError:
+        installed = None
+    
+    if installed and parse_version(installed) >= PYINSTALLER_MIN_VERSION:
+        return
+    
+    minimum = ".".join(map(str, PYINSTALLER_MIN_VERSION))
+    print(f"Installing pyinstaller>={minimum} (found {installed or 'none'})...")
+    subprocess.check_call([
+        sys.executable, "-m", "pip", "install",
+        "--prefer-binary",
+        "--cache-dir", PIP_CACHE,
+        f"pyinstaller>={minimum}"
+    ])
+
+# Executables built with PyInstaller. Each target is built by its own PyInstaller
+# process, so adding targets does not add to the total build time on multi-core machines
+PYINSTALLER_TARGETS = [
+    {"name": "OpenWebUI-Export-GUI", "script": "gui/program.py", "windowed": True},
+]
+
+# Generated spec files are kept alongside PyInstaller's work files so warm builds can reuse them
+SPEC_DIR = os.path.join("gui", "build")
+
+def get_makespec_args(target, onefile):
+    """
+    Get the PyInstaller options that are recorded in a target's spec file.
+    
+    Args:
+        target (dict): Target descriptor with name, script and windowed keys
+        onefile (bool): Whether to build a single self-extracting executable
+    
+    Returns:
+        list: Arguments that generate the spec file and build from it
+    """
+    args = [
+        f"--name={target['name']}",
+        "--windowed" if target["windowed"] else "",  # No console window
+        "--onefile" if onefile else "--onedir",
+        f"--icon={os.path.abspath('gui/icon.ico')}" if os.path.exists("gui/icon.ico") else "",
+        f"--specpath={SPEC_DIR}",
+        "--optimize=2",  # Optimized bytecode for all bundled modules
+        "--noupx",  # Skip UPX: no compression at build time and no decompression at every launch
+        # Test suites and libraries pulled in by optional dependencies that the GUI never imports
+        "--exclude-module=pandas.tests",
+        "--exclude-module=numpy.tests",
+        "--exclude-module=scipy",
+        # Standard library and packaging modules the GUI does not use
+        "--exclude-module=unittest",
+        "--exclude-module=test",
+        "--exclude-module=distutils",
+        "--exclude-module=setuptools",
+        "--exclude-module=pip",
+        # PyInstaller appends __main__ to the excludes list itself, which makes the
+        # recorded excludes differ from the spec and forces a fresh analysis on
+        # every build. Listing it here keeps the cached analysis valid.
+        "--exclude-module=__main__",
+        target["script"]
     ]
     
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            print(f"Package {package} not found. Installing...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-            print(f"Package {package} installed successfully.")
+    # Remove empty arguments
+    return [arg for arg in args if arg]
+
+def get_pyinstaller_args(target, onefile, clean=False):
+    """
+    Get the PyInstaller command-line arguments for a single target.
+    
+    If the target's spec file was generated from the same options, PyInstaller is
+    pointed at the spec and reuses the analysis cached in gui/build. Otherwise the
+    spec is regenerated.
+    
+    Args:
+        target (dict): Target descriptor with name, script and windowed keys
+        onefile (bool): Whether to build a single self-extracting executable
+        clean (bool): Whether to clear PyInstaller's cache before building
+    
+    Returns:
+        list: Arguments to pass to PyInstaller
+    """
+    spec_path = os.path.join(SPEC_DIR, f"{target['name']}.spec")
+    key_path = f"{spec_path}.key"
+    
+    makespec_args = get_makespec_args(target, onefile)
+    spec_key = hashlib.sha256(repr(makespec_args).encode()).hexdigest()
+    
+    common_args = [
+        "--distpath=gui/dist",  # Output to gui/dist directory
+        "--workpath=gui/build",  # Work files in gui/build directory
+        "--noconfirm",  # Replace the previous output without prompting
+        "--clean" if clean else "",
+    ]
+    common_args = [arg for arg in common_args if arg]
+    
+    try:
+        with open(key_path, 'r', encoding='utf-8') as f:
+            spec_is_current = os.path.exists(spec_path) and f.read().strip() == spec_key
+    except OSError:
+        spec_is_current = False
+    
+    if spec_is_current:
+        print(f"Reusing {spec_path}")
+        return [*common_args, spec_path]
+    
+    os.makedirs(SPEC_DIR, exist_ok=True)
+    with open(key_path, 'w', encoding='utf-8') as f:
+        f.write(spec_key)
+    
+    return [*common_args, *makespec_args]
+
+def get_pyinstaller_config_dir(target):
+    """
+    Get the PyInstaller cache directory used for a target.
+    
+    The cache holds stripped/compressed copies of every bundled binary and is kept
+    between builds. Pass --clean to the build script, or delete the directory, to wipe it.
+    """
+    return os.path.abspath(os.path.join("gui", "build", "pyinstaller-config", target["name"]))
 
-def build_gui():
-    """Build the GUI application."""
+def start_pyinstaller_build(target, onefile, clean=False):
+    """
+    Start a PyInstaller build for a single target in a separate interpreter.
+    
+    Args:
+        target (dict): Target descriptor with name, script and windowed keys
+        onefile (bool): Whether to build a single self-extracting executable
+        clean (bool): Whether to clear PyInstaller's cache before building
+    
+    Returns:
+        subprocess.Popen: The running PyInstaller process
+    """
+    command = [
+        sys.executable, "-OO", "-m", "PyInstaller",  # Optimized bytecode for all bundled modules
+        *get_pyinstaller_args(target, onefile, clean)
+    ]
+    
+    # Give each process its own PyInstaller cache so concurrent builds cannot corrupt it
+    env = {**os.environ, "PYINSTALLER_CONFIG_DIR": get_pyinstaller_config_dir(target)}
+    
+    return subprocess.Popen(command, env=env)
+
+def run_pyinstaller_in_process(target, onefile, clean=False):
+    """
+    Build a single target by running PyInstaller inside this interpreter.
+    
+    This avoids starting a second Python interpreter and re-importing PyInstaller.
+    
+    Args:
+        target (dict): Target descriptor with name, script and windowed keys
+        onefile (bool): Whether to build a single self-extracting executable
+        clean (bool): Whether to clear PyInstaller's cache before building
+    """
+    # PyInstaller reads its cache location when it is imported
+    os.environ["PYINSTALLER_CONFIG_DIR"] = get_pyinstaller_config_dir(target)
+    from PyInstaller.__main__ import run as pyi_run
+    
+    pyi_run(get_pyinstaller_args(target, onefile, clean))
+
+def build_gui(targets=PYINSTALLER_TARGETS, isolated=False, clean=False):
+    """
+    Build the GUI application.
+    
+    Args:
+        targets (list): Target descriptors to build
+        isolated (bool): Whether to run PyInstaller in a separate interpreter even for a single target
+        clean (bool): Whether to clear PyInstaller's cache before building
+    """
     print("\n=== Building GUI Application ===")
     
     # Create gui/dist directory if it doesn't exist
     os.makedirs("gui/dist", exist_ok=True)
     
-    # Define PyInstaller command for GUI
+    # One-folder builds launch directly from the extracted files; set
+    # PYINSTALLER_BUILD_ONEFILE=yes to get a single self-extracting executable
+    onefile = os.environ.get("PYINSTALLER_BUILD_ONEFILE") == "yes"
+    
+    if len(targets) == 1 and not isolated:
+        run_pyinstaller_in_process(targets[0], onefile, clean)
+    else:
+        # Run PyInstaller for all targets concurrently, then wait for every one of them
+        processes = [(target, start_pyinstaller_build(target, onefile, clean)) for target in targets]
+        failed = [target["name"] for target, process in processes if process.wait() != 0]
+        
+        if failed:
+            raise RuntimeError(f"PyInstaller failed for: {', '.join(failed)}")
+    
+    print("GUI application built successfully.")
+    for target in targets:
+        output_path = os.path.abspath(os.path.join("gui", "dist", target["name"]))
+        if onefile:
+            print(f"Executable created at: {output_path}")
+        else:
+            print(f"Application folder created at: {output_path}{os.sep}")
+
+def build_gui_nuitka():
+    """Build the GUI application with Nuitka."""
+    print("\n=== Building GUI Application (Nuitka) ===")
+    
+    # Create gui/dist directory if it doesn't exist
+    os.makedirs("gui/dist", exist_ok=True)
+    
+    # Define Nuitka command for GUI
     gui_command = [
-        "pyinstaller",
-        "--name=OpenWebUI-Export-GUI",
-        "--windowed",  # No console window
-        "--onefile",   # Single executable file
-        "--icon=gui/icon.ico" if os.path.exists("gui/icon.ico") else "",
-        "--distpath=gui/dist",  # Output to gui/dist directory
-        "--workpath=gui/build",  # Work files in gui/build directory
-        "--clean",
+        sys.executable, "-m", "nuitka",
+        "--standalone",
+        "--enable-plugin=tk-inter",
+        "--assume-yes-for-downloads",
+        "--noinclude-pytest-mode=nofollow",
+        "--noinclude-setuptools-mode=nofollow",
+        "--output-dir=gui/dist",
         "gui/program.py"
     ]
     
-    # Remove empty arguments
-    gui_command = [arg for arg in gui_command if arg]
-    
-    # Run PyInstaller
+    # Run Nuitka
     subprocess.check_call(gui_command)
     
     print("GUI application built successfully.")
-    print(f"Executable created at: {os.path.abspath('gui/dist/OpenWebUI-Export-GUI')}")
+    print(f"Application folder created at: {os.path.abspath('gui/dist/program.dist')}{os.sep}")
 
 def main():
     """Main function to build the GUI application."""
+    parser = argparse.ArgumentParser(description='Build a standalone executable for the GUI application')
+    parser.add_argument('--backend', choices=['pyinstaller', 'nuitka'], default='pyinstaller',
+                        help='Build backend to use (default: pyinstaller; nuitka builds slower but runs faster)')
+    parser.add_argument('--with-optional', action='store_true',
+                        help='Also install the optional packages (pandas, pyarrow, ttkthemes) so their features are bundled')
+    parser.add_argument('--isolated', action='store_true',
+                        help='Run PyInstaller in a separate Python process instead of inside this script')
+    parser.add_argument('--clean', action='store_true',
+                        help="Clear PyInstaller's cache of stripped/compressed binaries before building")
+    parser.add_argument('--force', action='store_true',
+                        help='Re-check dependencies even if this environment has already been checked')
+    
+    args = parser.parse_args()
+    
     print("=== OpenWebUI Model Export Converter Build Script ===")
     
-    # Check if PyInstaller is installed
-    check_pyinstaller()
+    if args.force and os.path.exists(ENV_MARKER):
+        os.remove(ENV_MARKER)
+    
+    # Check if the build backend and all dependencies are installed, unless
+    # this exact environment has already been checked
+    packages = get_required_packages(args.backend, args.with_optional)
+    env_key = environment_key(packages)
+    if environment_is_cached(env_key):
+        print("Dependencies already checked for this environment (use --force to re-check).")
+    else:
+        check_dependencies(packages)
+        if args.backend == "pyinstaller":
+            check_pyinstaller_version()
+            check_pefile_pin()
+        save_environment_key(env_key)
     
-    # Check if all dependencies are installed
-    check_dependencies()
+    if args.backend == "nuitka":
+        check_c_compiler()
     
     # Build GUI application
-    build_gui()
+    if args.backend == "nuitka":
+        build_gui_nuitka()
+    else:
+        build_gui(isolated=args.isolated, clean=args.clean)
     
     print("\n=== Build Completed Successfully ===")
-    print("The executable is available in the 'gui/dist' directory.")
+    print("The application is available in the 'gui/dist' directory.")
 
 if __name__ == "__main__":
     main()
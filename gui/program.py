@@ -7,15 +7,85 @@ and output format options.
 import json
 import csv
 import os
+import re
+import mmap
+import importlib.util
+import functools
 import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from datetime import datetime
 import threading
-import yaml
-import xml.dom.minidom
-import pandas as pd
-import traceback
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# orjson is optional; it parses large exports several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Control characters that are not allowed in XML text
+_XML_INVALID_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Terms that mark an entry as containing personal information
+_PERSONAL_RE = re.compile(r'daniel|rosehill', re.IGNORECASE)
+
+# Characters dropped from model names when building filenames (keeps letters, digits, "-" and "_")
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w-]+')
+
+# Content of the individual markdown file created for each model
+_MODEL_MARKDOWN_TEMPLATE = "## {name}\n\n## Description\n\n{description}\n\n## System Prompt\n\n{system_prompt}\n"
+
+# Markdown cells longer than this are escaped without going through the cache
+_MD_ESCAPE_CACHE_MAX_LEN = 1024
+
+@functools.lru_cache(maxsize=4096)
+def _md_escape_cached(value):
+    return value.replace("|", "\\|").replace("\n", "<br>")
+
+def _md_escape(value):
+    """Escape pipe characters and newlines for a markdown table cell"""
+    # Short values such as tags and categories repeat across rows, so reuse their escaped form
+    if len(value) <= _MD_ESCAPE_CACHE_MAX_LEN:
+        return _md_escape_cached(value)
+    return value.replace("|", "\\|").replace("\n", "<br>")
+
+def _write_text_file(path, text):
+    """Write text to a file as UTF-8"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def _compile_accessor(field):
+    """
+    Compile a function that looks up a dotted field path (e.g. "info.meta.description")
+    in a model dictionary.
+    
+    The lookup chain is generated as source once per field, so extracting a field from
+    each model is a single function call rather than a split and a loop over the parts.
+    Missing keys and non-dict intermediate values give an empty string.
+    """
+    lookup = "item" + "".join(f".get({part!r}, '')" for part in field.split('.'))
+    source = (
+        "def accessor(item):\n"
+        "    try:\n"
+        f"        return {lookup}\n"
+        "    except (AttributeError, TypeError):\n"
+        "        return ''\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace["accessor"]
+
+# Fields shown first in tabular exports, in this order
+PRIMARY_FIELDS = ["name", "info.meta.description", "info.params.system"]
+
+# User-friendly column headers for tabular exports
+HEADER_MAPPING = {
+    "name": "name",
+    "info.meta.description": "description",
+    "info.params.system": "system_prompt"
+}
 
 class ExportApp:
     def __init__(self, root):
@@ -38,6 +108,21 @@ class ExportApp:
         self.create_individual_files_var = tk.BooleanVar(value=True)  
         self.progress_var = tk.DoubleVar(value=0.0)
         self.status_var = tk.StringVar(value="Ready")
+        self._last_progress_pct = -1
+        
+        # Status updates posted by the export thread, applied by the main thread at 20 Hz
+        self._status_queue = queue.Queue()
+        
+        # Message boxes requested by the export thread, shown by the main thread
+        self._dialog_queue = queue.Queue()
+        
+        # Field plan and DataFrame shared by the exporters during an export. Each
+        # cache has its own lock, which stops concurrent exporters from building the
+        # same thing twice without making the quick plan lookup wait on a DataFrame build
+        self._plan_lock = threading.Lock()
+        self._dataframe_lock = threading.Lock()
+        self._cached_plan = None
+        self._cached_columnar_dataframe = None
         
         # Field selection variables and structure
         self.field_vars = {}
@@ -79,6 +164,9 @@ class ExportApp:
         
         # Initialize field checkboxes
         self.initialize_field_checkboxes()
+        
+        # Start applying status updates from the export thread
+        self.root.after(50, self._drain_status_queue)
     
     def create_ui(self):
         """Create the user interface"""
@@ -124,6 +212,8 @@ class ExportApp:
             ("YAML (.yaml)", "yaml"),
             ("XML (.xml)", "xml"),
             ("Markdown Table (.md)", "markdown"),
+            ("Parquet (.parquet, fastest)", "parquet"),
+            ("Feather (.feather, fastest)", "feather"),
             ("All Formats", "all")
         ]
         format_frame = ttk.Frame(options_frame)
@@ -312,123 +402,126 @@ class ExportApp:
                 "excel": ".xlsx",
                 "yaml": ".yaml",
                 "xml": ".xml",
-                "markdown": ".md"
+                "markdown": ".md",
+                "parquet": ".parquet",
+                "feather": ".feather"
             }
             
             # Read input JSON
             self.update_status("Reading input file...", 5)
-            with open(self.input_file_var.get(), 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(self.input_file_var.get(), 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        # Parse straight from the mapped file, without reading it into a bytes copy
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                            data = orjson.loads(view)
+                    else:
+                        # mmap cannot map an empty file; let orjson report the error
+                        data = orjson.loads(f.read())
+            else:
+                with open(self.input_file_var.get(), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             if not isinstance(data, list):
                 raise ValueError(f"Expected a JSON array, but got {type(data).__name__}")
             
-            # Filter personal information if requested
-            if self.filter_personal_var.get():
-                self.update_status("Filtering personal information...", 10)
-                personal_terms = ["Daniel", "Rosehill", "daniel", "rosehill"]
-                filtered_data = []
-                total_items = len(data)
-                
-                for i, item in enumerate(data):
-                    if not self.contains_personal_info(item, personal_terms):
-                        filtered_data.append(item)
-                    self.update_status(f"Filtering: {i+1}/{total_items}", 10 + (i+1) * 20 / total_items)
-                
-                data = filtered_data
+            # Create a timestamped folder for all outputs
+            timestamp_dir = os.path.join(self.output_dir_var.get(), f"export_{timestamp}")
+            os.makedirs(timestamp_dir, exist_ok=True)
+            
+            filter_personal = self.filter_personal_var.get()
+            create_individual_files = self.create_individual_files_var.get()
             
-            # Extract selected fields
-            self.update_status("Extracting selected fields...", 30)
+            if create_individual_files:
+                # Create individual-configs subfolder
+                individual_configs_dir = os.path.join(timestamp_dir, "individual-configs")
+                os.makedirs(individual_configs_dir, exist_ok=True)
+            
+            # Compile a lookup function for each selected field
+            accessors = [(field, _compile_accessor(field)) for field in selected_fields]
+            
+            # Filter, extract selected fields and write individual markdown files in a single pass
+            self.update_status("Processing models...", 10)
             extracted_data = []
+            individual_files = {}
             total_items = len(data)
             
+            # Report progress roughly once per percent rather than for every item
+            status_step = max(1, total_items // 100)
+            
             for i, item in enumerate(data):
-                extracted_item = {}
-                for field in selected_fields:
-                    # Handle nested fields (e.g., "info.meta.description")
-                    field_parts = field.split('.')
-                    value = item
-                    
-                    try:
-                        for part in field_parts:
-                            value = value.get(part, "")
-                    except (AttributeError, TypeError):
-                        value = ""
-                    
-                    extracted_item[field] = value
+                if i % status_step == 0 or i == total_items - 1:
+                    self.update_status(f"Processing: {i+1}/{total_items}", 10 + (i+1) * 55 / total_items, throttle=True)
                 
-                extracted_data.append(extracted_item)
-                self.update_status(f"Extracting: {i+1}/{total_items}", 30 + (i+1) * 40 / total_items)
-            
-            # Create individual markdown files for each model (if option is selected)
-            if self.create_individual_files_var.get():
-                self.update_status("Creating individual model markdown files...", 65)
+                # Skip items with personal information if requested; one regex scan over
+                # the serialized item instead of walking every nested value
+                if filter_personal and _PERSONAL_RE.search(json.dumps(item, ensure_ascii=False)):
+                    continue
                 
-                # Create a timestamped folder for all outputs
-                timestamp_dir = os.path.join(self.output_dir_var.get(), f"export_{timestamp}")
-                os.makedirs(timestamp_dir, exist_ok=True)
+                # Handle nested fields (e.g., "info.meta.description") via the compiled accessors
+                extracted_item = {field: accessor(item) for field, accessor in accessors}
                 
-                # Create individual-configs subfolder
-                individual_configs_dir = os.path.join(timestamp_dir, "individual-configs")
-                os.makedirs(individual_configs_dir, exist_ok=True)
+                extracted_data.append(extracted_item)
                 
-                # Create individual markdown files
-                for i, item in enumerate(extracted_data):
-                    model_name = item.get("name", "Unknown Model")
-                    description = item.get("info.meta.description", "")
-                    system_prompt = item.get("info.params.system", "")
+                # Create an individual markdown file for the model (if option is selected)
+                if create_individual_files:
+                    model_name = extracted_item.get("name", "Unknown Model")
+                    description = extracted_item.get("info.meta.description", "")
+                    system_prompt = extracted_item.get("info.params.system", "")
                     
                     # Create a computer-friendly filename
                     filename = model_name.lower().replace(" ", "-").replace("/", "-").replace("\\", "-")
-                    filename = ''.join(c for c in filename if c.isalnum() or c in ['-', '_'])
-                    filename = f"{filename}.md"
-                    
-                    # Write the markdown file
-                    with open(os.path.join(individual_configs_dir, filename), 'w', encoding='utf-8') as f:
-                        f.write(f"## {model_name}\n\n")
-                        f.write("## Description\n\n")
-                        f.write(f"{description}\n\n")
-                        f.write("## System Prompt\n\n")
-                        f.write(f"{system_prompt}\n")
+                    filename = f"{_FILENAME_UNSAFE_RE.sub('', filename)}.md"
                     
-                    self.update_status(f"Creating individual files: {i+1}/{len(extracted_data)}", 65 + (i+1) * 5 / len(extracted_data))
-            else:
-                # Skip individual files creation
-                self.update_status("Skipping individual markdown files creation...", 65)
-                
-                # Still need to create the timestamp directory for other outputs
-                timestamp_dir = os.path.join(self.output_dir_var.get(), f"export_{timestamp}")
-                os.makedirs(timestamp_dir, exist_ok=True)
+                    # Render the markdown now and write all files together after the loop;
+                    # a later model with the same filename replaces an earlier one
+                    individual_files[os.path.join(individual_configs_dir, filename)] = _MODEL_MARKDOWN_TEMPLATE.format(
+                        name=model_name, description=description, system_prompt=system_prompt
+                    )
+            
+            # Write the individual markdown files concurrently to overlap the file system calls
+            if create_individual_files:
+                self.update_status(f"Creating individual files: {len(individual_files)}...", 65)
+                with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                    list(executor.map(_write_text_file, individual_files.keys(), individual_files.values()))
+            
+            # Every extracted item has exactly the selected fields, so the column plan
+            # comes from them directly instead of from a scan of all the rows
+            self._set_field_plan(extracted_data, selected_fields)
             
             # Export to selected format(s)
             export_format = self.export_format_var.get()
             
             if export_format == "all":
                 # Export to all formats
-                formats = ["csv", "json", "excel", "yaml", "xml", "markdown"]
+                formats = ["csv", "json", "yaml", "xml", "markdown"]
+                
+                # Excel needs xlsxwriter or openpyxl, so only include it when one is installed
+                if any(importlib.util.find_spec(name) is not None for name in ("xlsxwriter", "openpyxl")):
+                    formats.insert(2, "excel")
+                
+                # The columnar formats are written through pandas with pyarrow, so only
+                # include them when both are installed
+                if all(importlib.util.find_spec(name) is not None for name in ("pandas", "pyarrow")):
+                    formats += ["parquet", "feather"]
                 total_formats = len(formats)
                 
-                for i, fmt in enumerate(formats):
-                    progress_base = 70 + (i * (30 / total_formats))
-                    progress_next = 70 + ((i + 1) * (30 / total_formats))
+                # The exporters write to separate files and spend most of their time in
+                # I/O and C extensions, so run them concurrently
+                self.update_status(f"Exporting to {total_formats} formats...", 70)
+                with ThreadPoolExecutor(max_workers=total_formats) as executor:
+                    futures = {
+                        executor.submit(
+                            self.export_to_format, fmt, extracted_data,
+                            os.path.join(timestamp_dir, f"models{format_ext[fmt]}")
+                        ): fmt
+                        for fmt in formats
+                    }
                     
-                    self.update_status(f"Exporting to {fmt.upper()} ({i+1}/{total_formats})...", progress_base)
-                    output_path = os.path.join(timestamp_dir, f"models{format_ext[fmt]}")
-                    
-                    if fmt == "csv":
-                        self.export_to_csv(extracted_data, output_path)
-                    elif fmt == "json":
-                        self.export_to_json(extracted_data, output_path)
-                    elif fmt == "excel":
-                        self.export_to_excel(extracted_data, output_path)
-                    elif fmt == "yaml":
-                        self.export_to_yaml(extracted_data, output_path)
-                    elif fmt == "xml":
-                        self.export_to_xml(extracted_data, output_path)
-                    elif fmt == "markdown":
-                        self.export_to_markdown(extracted_data, output_path)
-                    
-                    self.update_status(f"Exported to {fmt.upper()} ({i+1}/{total_formats})", progress_next)
+                    for i, future in enumerate(as_completed(futures)):
+                        future.result()
+                        self.update_status(f"Exported to {futures[future].upper()} ({i+1}/{total_formats})",
+                                           70 + ((i + 1) * (30 / total_formats)))
                 
                 self.update_status(f"Export completed successfully to all formats", 100)
                 
@@ -440,24 +533,13 @@ class ExportApp:
                 if self.create_individual_files_var.get():
                     success_message += f"\n\nIndividual model markdown files created in:\n- export_{timestamp}/individual-configs/"
                 
-                self.root.after(0, lambda: messagebox.showinfo("Success", success_message))
+                self.show_dialog(messagebox.showinfo, "Success", success_message)
             else:
                 # Export to a single format
                 output_path = os.path.join(timestamp_dir, f"models{format_ext[export_format]}")
                 self.update_status(f"Exporting to {export_format.upper()}...", 70)
                 
-                if export_format == "csv":
-                    self.export_to_csv(extracted_data, output_path)
-                elif export_format == "json":
-                    self.export_to_json(extracted_data, output_path)
-                elif export_format == "excel":
-                    self.export_to_excel(extracted_data, output_path)
-                elif export_format == "yaml":
-                    self.export_to_yaml(extracted_data, output_path)
-                elif export_format == "xml":
-                    self.export_to_xml(extracted_data, output_path)
-                elif export_format == "markdown":
-                    self.export_to_markdown(extracted_data, output_path)
+                self.export_to_format(export_format, extracted_data, output_path)
                 
                 self.update_status(f"Export completed successfully: {os.path.basename(output_path)}", 100)
                 
@@ -468,248 +550,327 @@ class ExportApp:
                 if self.create_individual_files_var.get():
                     success_message += f"Individual model markdown files created in:\n- export_{timestamp}/individual-configs/"
                 
-                self.root.after(0, lambda: messagebox.showinfo("Success", success_message))
+                self.show_dialog(messagebox.showinfo, "Success", success_message)
             
         except Exception as e:
+            import traceback
             error_message = f"Error during export: {str(e)}\n\n{traceback.format_exc()}"
             self.update_status(f"Error: {str(e)}", 0)
-            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+            self.show_dialog(messagebox.showerror, "Error", error_message)
+        finally:
+            self._clear_export_cache()
     
-    def update_status(self, message, progress):
-        """Update status message and progress bar"""
-        self.root.after(0, lambda: self.status_var.set(message))
-        self.root.after(0, lambda: self.progress_var.set(progress))
+    def update_status(self, message, progress, throttle=False):
+        """
+        Update status message and progress bar
+        
+        With throttle set, the update is skipped if the whole-percent progress has not
+        changed since the last update, to avoid flooding the Tk event queue from loops.
+        """
+        percent = int(progress)
+        if throttle and percent == self._last_progress_pct:
+            return
+        self._last_progress_pct = percent
+        
+        # Hand the update to the main thread, which applies it in _drain_status_queue
+        self._status_queue.put_nowait((message, progress))
     
-    def contains_personal_info(self, obj, personal_terms):
-        """Check if an object contains personal information"""
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if isinstance(value, (dict, list)):
-                    if self.contains_personal_info(value, personal_terms):
-                        return True
-                elif isinstance(value, str):
-                    for term in personal_terms:
-                        if term in value:
-                            return True
-        elif isinstance(obj, list):
-            for item in obj:
-                if self.contains_personal_info(item, personal_terms):
-                    return True
-        elif isinstance(obj, str):
-            for term in personal_terms:
-                if term in obj:
-                    return True
-        return False
+    def show_dialog(self, show, title, message):
+        """
+        Show a message box from the export thread
+        
+        Args:
+            show: messagebox function to call, e.g. messagebox.showinfo
+            title (str): Title of the message box
+            message (str): Text of the message box
+        """
+        # Tk must only be used from the main thread, which shows it in _drain_status_queue
+        self._dialog_queue.put_nowait((show, title, message))
     
-    def export_to_csv(self, data, output_path):
-        """Export data to CSV format"""
-        if not data:
-            raise ValueError("No data to export")
+    def _drain_status_queue(self):
+        """Apply the latest queued status update and show queued dialogs, then check again in 50 ms"""
+        latest = None
+        try:
+            while True:
+                latest = self._status_queue.get_nowait()
+        except queue.Empty:
+            pass
         
-        # Define the primary fields in the desired order
-        primary_fields = ["name", "info.meta.description", "info.params.system"]
+        if latest is not None:
+            message, progress = latest
+            self.status_var.set(message)
+            self.progress_var.set(progress)
         
-        # Get all unique keys from all items
-        all_keys = set()
-        for item in data:
-            all_keys.update(item.keys())
+        # Dialogs come after the status, so the final status is visible behind them
+        try:
+            while True:
+                show, title, message = self._dialog_queue.get_nowait()
+                show(title, message)
+        except queue.Empty:
+            pass
         
-        # Sort keys with primary fields first, then others alphabetically
-        fieldnames = []
+        self.root.after(50, self._drain_status_queue)
+    
+    def _field_plan(self, data):
+        """
+        Work out the column order and friendly header names for tabular exports.
+        
+        The result is cached for the data it was computed from, so exporting the same
+        data to several formats only computes it once.
+        
+        Returns:
+            tuple: (fieldnames, headers) with the primary fields first, then the others alphabetically
+        """
+        with self._plan_lock:
+            if self._cached_plan is None or self._cached_plan[0] is not data:
+                # Get all unique keys from all items
+                fields = dict.fromkeys(key for item in data for key in item)
+                self._cached_plan = (data, self._build_field_plan(fields))
+            return self._cached_plan[1]
+    
+    def _set_field_plan(self, data, fields):
+        """Seed the field plan cache for data whose items all have exactly the given fields"""
+        with self._plan_lock:
+            self._cached_plan = (data, self._build_field_plan(fields))
+    
+    def _build_field_plan(self, fields):
+        """Compute the column order and friendly header names for the given fields (see _field_plan)"""
+        # Sort keys with primary fields first (if they exist in the data), then others alphabetically
+        fieldnames = [field for field in PRIMARY_FIELDS if field in fields]
+        fieldnames.extend(sorted(field for field in fields if field not in PRIMARY_FIELDS))
         
-        # Add primary fields first (if they exist in the data)
-        for field in primary_fields:
-            if field in all_keys:
-                fieldnames.append(field)
-                all_keys.remove(field)
+        # Rename the headers to be more user-friendly
+        headers = [HEADER_MAPPING.get(field, field) for field in fieldnames]
         
-        # Add remaining fields alphabetically
-        fieldnames.extend(sorted(all_keys))
+        return fieldnames, headers
+    
+    def _prepare_columnar_dataframe(self, data):
+        """Build the DataFrame shared by the Parquet and Feather exporters (cached like _field_plan)"""
+        with self._dataframe_lock:
+            if self._cached_columnar_dataframe is None or self._cached_columnar_dataframe[0] is not data:
+                self._cached_columnar_dataframe = (data, self._build_columnar_dataframe(data))
+            return self._cached_columnar_dataframe[1]
+    
+    def _build_columnar_dataframe(self, data):
+        """Create the Arrow-compatible DataFrame (see _prepare_columnar_dataframe)"""
+        if not data:
+            raise ValueError("No data to export")
         
-        # Rename the headers to be more user-friendly
-        header_mapping = {
-            "name": "name",
-            "info.meta.description": "description",
-            "info.params.system": "system_prompt"
-        }
+        # pandas is heavy and only needed here, so import it on first use
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise RuntimeError(f"This export format requires pandas (pip install pandas): {e}") from e
+        
+        # Create a DataFrame with ordered columns and friendly names
+        fieldnames, headers = self._field_plan(data)
+        df = pd.DataFrame(data, columns=fieldnames)
+        df.columns = headers
+        
+        # Arrow columns need a single type: store nested values (tags, actions) as JSON
+        # text, and columns that mix types (e.g. booleans and "" for missing) as strings
+        for column in df.columns:
+            values = [
+                json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+                for value in df[column]
+            ]
+            if len({type(value) for value in values}) > 1:
+                values = ["" if value is None else str(value) for value in values]
+            df[column] = values
+        
+        return df
+    
+    def _clear_export_cache(self):
+        """Release the cached field plan and DataFrame"""
+        self._cached_plan = None
+        self._cached_columnar_dataframe = None
+    
+    def export_to_format(self, fmt, data, output_path):
+        """Export data to a single format"""
+        if fmt == "csv":
+            self.export_to_csv(data, output_path)
+        elif fmt == "json":
+            self.export_to_json(data, output_path)
+        elif fmt == "excel":
+            self.export_to_excel(data, output_path)
+        elif fmt == "yaml":
+            self.export_to_yaml(data, output_path)
+        elif fmt == "xml":
+            self.export_to_xml(data, output_path)
+        elif fmt == "markdown":
+            self.export_to_markdown(data, output_path)
+        elif fmt == "parquet":
+            self.export_to_parquet(data, output_path)
+        elif fmt == "feather":
+            self.export_to_feather(data, output_path)
+    
+    def export_to_csv(self, data, output_path):
+        """Export data to CSV format"""
+        if not data:
+            raise ValueError("No data to export")
         
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            # Use custom header names for the CSV
-            writer = csv.writer(f)
+        fieldnames, headers = self._field_plan(data)
+        
+        with open(output_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval="", extrasaction='ignore',
+                                    quoting=csv.QUOTE_MINIMAL)
             
             # Write header row with friendly names
-            header_row = []
-            for field in fieldnames:
-                header_row.append(header_mapping.get(field, field))
+            writer.writerow(dict(zip(fieldnames, headers)))
             
-            writer.writerow(header_row)
-            
-            # Write data rows
-            for item in data:
-                row = []
-                for field in fieldnames:
-                    row.append(item.get(field, ""))
-                writer.writerow(row)
+            # Write data rows (the per-row work happens inside the csv module)
+            writer.writerows(data)
     
     def export_to_excel(self, data, output_path):
         """Export data to Excel format"""
         if not data:
             raise ValueError("No data to export")
-            
-        # Define the primary fields in the desired order
-        primary_fields = ["name", "info.meta.description", "info.params.system"]
-        
-        # Get all unique keys from all items
-        all_keys = set()
-        for item in data:
-            all_keys.update(item.keys())
-        
-        # Sort keys with primary fields first, then others alphabetically
-        fieldnames = []
-        
-        # Add primary fields first (if they exist in the data)
-        for field in primary_fields:
-            if field in all_keys:
-                fieldnames.append(field)
-                all_keys.remove(field)
         
-        # Add remaining fields alphabetically
-        fieldnames.extend(sorted(all_keys))
+        fieldnames, headers = self._field_plan(data)
         
-        # Rename the headers to be more user-friendly
-        header_mapping = {
-            "name": "name",
-            "info.meta.description": "description",
-            "info.params.system": "system_prompt"
-        }
-        
-        # Create a DataFrame with ordered columns
-        df = pd.DataFrame(data)
-        
-        # Reorder columns based on fieldnames
-        ordered_columns = [col for col in fieldnames if col in df.columns]
-        df = df[ordered_columns]
+        # Rows go straight from the extracted data to the workbook, without a DataFrame
+        rows = (
+            # Cells hold scalars only; lists and dicts are written as text
+            [str(value) if isinstance(value, (dict, list)) else value
+             for value in (item.get(field, "") for field in fieldnames)]
+            for item in data
+        )
         
-        # Rename columns
-        rename_dict = {col: header_mapping.get(col, col) for col in df.columns}
-        df = df.rename(columns=rename_dict)
+        try:
+            import xlsxwriter
+        except ImportError:
+            xlsxwriter = None
+        
+        if xlsxwriter is not None:
+            # constant_memory streams each row to disk as soon as the next one starts,
+            # so rows must be written strictly in order
+            workbook = xlsxwriter.Workbook(output_path, {
+                'constant_memory': True,
+                'strings_to_urls': False,
+                'strings_to_formulas': False
+            })
+            try:
+                worksheet = workbook.add_worksheet()
+                worksheet.write_row(0, 0, headers)
+                for row_num, row in enumerate(rows, 1):
+                    worksheet.write_row(row_num, 0, row)
+            finally:
+                workbook.close()
+            return
         
-        # Export to Excel
-        df.to_excel(output_path, index=False)
+        # Fall back to openpyxl's streaming write-only mode
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise RuntimeError("Excel export requires xlsxwriter or openpyxl (pip install xlsxwriter)")
+        
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        worksheet.append(headers)
+        for row in rows:
+            worksheet.append(row)
+        workbook.save(output_path)
+    
+    def export_to_parquet(self, data, output_path):
+        """Export data to Parquet format"""
+        df = self._prepare_columnar_dataframe(data)
+        df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+    
+    def export_to_feather(self, data, output_path):
+        """Export data to Feather format"""
+        df = self._prepare_columnar_dataframe(data)
+        df.reset_index(drop=True).to_feather(output_path, compression='zstd')
     
     def export_to_json(self, data, output_path):
         """Export data to JSON format"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Serialize straight to UTF-8 bytes and write them in a single call
+        if orjson is not None:
+            output = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            output = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        with open(output_path, 'wb') as f:
+            f.write(output)
     
     def export_to_yaml(self, data, output_path):
         """Export data to YAML format"""
+        # Imported here so the GUI starts without loading PyYAML; use the
+        # libyaml-based dumper when PyYAML was built with it
+        import yaml
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        
         with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
     
     def export_to_xml(self, data, output_path):
         """Export data to XML format"""
-        doc = xml.dom.minidom.getDOMImplementation().createDocument(None, "models", None)
-        root = doc.documentElement
+        # lxml is optional; it builds and serializes XML faster than the standard
+        # library, which provides the same ElementTree API as a fallback
+        try:
+            from lxml import etree
+        except ImportError:
+            import xml.etree.ElementTree as etree
+        
+        root = etree.Element("models")
         
         for item in data:
-            model_elem = doc.createElement("model")
-            root.appendChild(model_elem)
+            model_elem = etree.SubElement(root, "model")
+            
+            # Nested elements created for this model, keyed by their path (e.g. ("info", "meta"))
+            path_cache = {}
             
             for key, value in item.items():
                 # Handle nested keys
-                if '.' in key:
-                    parts = key.split('.')
-                    current_elem = model_elem
-                    
-                    # Create nested elements for each part except the last
-                    for i, part in enumerate(parts[:-1]):
-                        # Check if this element already exists
-                        existing = None
-                        for child in current_elem.childNodes:
-                            if child.nodeName == part:
-                                existing = child
-                                break
-                        
-                        if existing is None:
-                            new_elem = doc.createElement(part)
-                            current_elem.appendChild(new_elem)
-                            current_elem = new_elem
-                        else:
-                            current_elem = existing
-                    
-                    # Add the value to the last element
-                    field_elem = doc.createElement(parts[-1])
-                    text = doc.createTextNode(str(value) if value is not None else "")
-                    field_elem.appendChild(text)
-                    current_elem.appendChild(field_elem)
-                else:
-                    # Simple key
-                    field_elem = doc.createElement(key)
-                    text = doc.createTextNode(str(value) if value is not None else "")
-                    field_elem.appendChild(text)
-                    model_elem.appendChild(field_elem)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(doc.toprettyxml(indent="  "))
+                parts = key.split('.')
+                current_elem = model_elem
+                
+                # Find or create nested elements for each part except the last
+                for depth in range(1, len(parts)):
+                    path = tuple(parts[:depth])
+                    existing = path_cache.get(path)
+                    if existing is None:
+                        existing = path_cache[path] = etree.SubElement(current_elem, parts[depth - 1])
+                    current_elem = existing
+                
+                # Add the value to the last element
+                field_elem = etree.SubElement(current_elem, parts[-1])
+                field_elem.text = _XML_INVALID_RE.sub("", str(value)) if value is not None else ""
+        
+        etree.indent(root, space="  ")
+        with open(output_path, 'wb') as f:
+            f.write(etree.tostring(root, encoding="utf-8", xml_declaration=True))
+            f.write(b"\n")
     
     def export_to_markdown(self, data, output_path):
         """Export data to Markdown table format"""
         if not data:
             raise ValueError("No data to export")
         
-        # Define the primary fields in the desired order
-        primary_fields = ["name", "info.meta.description", "info.params.system"]
+        fieldnames, headers = self._field_plan(data)
         
-        # Get all unique keys from all items
-        all_keys = set()
-        for item in data:
-            all_keys.update(item.keys())
-        
-        # Sort keys with primary fields first, then others alphabetically
-        headers = []
-        
-        # Add primary fields first (if they exist in the data)
-        for field in primary_fields:
-            if field in all_keys:
-                headers.append(field)
-                all_keys.remove(field)
-        
-        # Add remaining fields alphabetically
-        headers.extend(sorted(all_keys))
+        # Build the whole markdown table in memory and write it once
+        parts = [
+            "# OpenWebUI Model Export\n\n",
+            "Generated on: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n\n",
+            # Table headers with friendly names
+            "| " + " | ".join(headers) + " |\n",
+            "| " + " | ".join(["---"] * len(headers)) + " |\n"
+        ]
         
-        # Rename the headers to be more user-friendly
-        header_mapping = {
-            "name": "name",
-            "info.meta.description": "description",
-            "info.params.system": "system_prompt"
-        }
+        # Table rows
+        for item in data:
+            row = []
+            for field in fieldnames:
+                value = item.get(field, "")
+                # Escape pipe characters and newlines for markdown
+                if isinstance(value, str):
+                    value = _md_escape(value)
+                row.append(str(value) if value is not None else "")
+            
+            parts.append("| " + " | ".join(row) + " |\n")
         
-        # Create markdown table
         with open(output_path, 'w', encoding='utf-8') as f:
-            # Write table header
-            f.write("# OpenWebUI Model Export\n\n")
-            f.write("Generated on: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n\n")
-            
-            # Write table headers with friendly names
-            header_row = []
-            for field in headers:
-                header_row.append(header_mapping.get(field, field))
-            
-            f.write("| " + " | ".join(header_row) + " |\n")
-            f.write("| " + " | ".join(["---"] * len(headers)) + " |\n")
-            
-            # Write table rows
-            for item in data:
-                row = []
-                for header in headers:
-                    value = item.get(header, "")
-                    # Escape pipe characters and newlines for markdown
-                    if isinstance(value, str):
-                        value = value.replace("|", "\\|").replace("\n", "<br>")
-                    row.append(str(value) if value is not None else "")
-                
-                f.write("| " + " | ".join(row) + " |\n")
+            f.write("".join(parts))
 
 def main():
     root = tk.Tk()
@@ -0,0 +1,156 @@
+"""
+Per-model field extraction and JSON streaming helpers shared by the command-line scripts.
+
+This is plain Python, kept small and annotated so that it can optionally be
+compiled with mypyc for faster extraction of large exports:
+
+    cd scripts && mypyc _projection.py
+
+Python imports the compiled extension in place of this file when it is present,
+so the scripts need no changes either way.
+"""
+
+import itertools
+import json
+import os
+from typing import Any, BinaryIO, Dict, Iterator, NamedTuple, Optional, Tuple
+
+# orjson is optional; it writes JSON several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# ijson is optional; it lets very large exports be processed one model at a time
+# instead of loading the whole file into memory
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+# Exports larger than this are streamed with ijson when it is installed
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+# Python type names for the first ijson event of a non-array document
+_EVENT_TYPES = {"start_map": "dict", "string": "str", "number": "float", "boolean": "bool", "null": "NoneType"}
+
+# Shared empty dict used in place of missing nested objects; never modified
+EMPTY: Dict[str, Any] = {}
+
+# Prefix of the OpenWebUI link written for each model
+_LINK_PREFIX = "openwebui://model/"
+
+class Model(NamedTuple):
+    """Fields extracted from one model; the order matches the CSV columns"""
+    name: Any
+    description: Any
+    system_prompt: Any
+    link: str
+
+def _get_dict(obj: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return obj[key] if it is a dict, otherwise EMPTY (used for malformed exports)"""
+    value = obj.get(key)
+    return value if isinstance(value, dict) else EMPTY
+
+def extract_prompt_fields(model: Dict[str, Any]) -> Tuple[Any, Any]:
+    """
+    Extract the description and system prompt of a model
+
+    Args:
+        model (dict): One model from the OpenWebUI export
+
+    Returns:
+        tuple: (description, system_prompt), with "" for missing values
+    """
+    # info, meta and params are dicts when present; any other value is a schema
+    # violation, which the slower type-checked lookup treats as missing
+    try:
+        info = model.get("info") or EMPTY
+        description = (info.get("meta") or EMPTY).get("description", "")
+        system_prompt = (info.get("params") or EMPTY).get("system", "")
+    except AttributeError:
+        info = _get_dict(model, "info")
+        description = _get_dict(info, "meta").get("description", "")
+        system_prompt = _get_dict(info, "params").get("system", "")
+
+    return description, system_prompt
+
+def project_model(model: Dict[str, Any]) -> Optional[Model]:
+    """
+    Extract the name, description, system prompt and link of a model
+
+    Args:
+        model (dict): One model from the OpenWebUI export
+
+    Returns:
+        Model: The model's name, description, system_prompt and link,
+               or None if the model has no system prompt
+    """
+    description, system_prompt = extract_prompt_fields(model)
+
+    # Models without a system prompt are skipped
+    if not system_prompt:
+        return None
+
+    return Model(
+        model.get("name", "").strip(),
+        description,
+        system_prompt,
+        _LINK_PREFIX + str(model.get("id", ""))
+    )
+
+def should_stream(input_file: str) -> bool:
+    """Check whether the input file is large enough to stream, and ijson is installed"""
+    return ijson is not None and os.path.getsize(input_file) > STREAM_THRESHOLD
+
+def stream_array(input_file: str) -> Optional[Iterator[Any]]:
+    """
+    Stream the items of the JSON array in the input file with ijson
+
+    Args:
+        input_file (str): Path to the input JSON file
+
+    Returns:
+        iterator: The items of the array, or None if the file is not a JSON array
+    """
+    f = open(input_file, 'rb')
+    try:
+        events = ijson.parse(f, use_float=True)
+
+        # Check that the document is an array before handing out its items
+        first = next(events, None)
+    except Exception:
+        f.close()
+        raise
+
+    if first is None or first[1] != "start_array":
+        f.close()
+        got = _EVENT_TYPES.get(first[1], first[1]) if first else "nothing"
+        print(f"Error: Expected a JSON array, but got {got}")
+        return None
+
+    def items() -> Iterator[Any]:
+        with f:
+            yield from ijson.items(itertools.chain([first], events), "item")
+
+    return items()
+
+def write_json_entry(f: BinaryIO, item: Dict[str, Any], first: bool) -> None:
+    """
+    Write one object as an element of a JSON array being written to f
+
+    The output matches json.dumps(items, indent=2), one element at a time.
+
+    Args:
+        f: Binary file handle for the output JSON file
+        item (dict): The object to write
+        first (bool): Whether this is the first element of the array
+    """
+    if orjson is not None:
+        entry = orjson.dumps(item, option=orjson.OPT_INDENT_2)
+    else:
+        entry = json.dumps(item, indent=2, ensure_ascii=False).encode('utf-8')
+
+    # Nest the object one level inside the array
+    f.write(b"\n  " if first else b",\n  ")
+    f.write(entry.replace(b"\n", b"\n  "))
@@ -5,56 +5,68 @@ import os
 import sys
 from datetime import datetime
 
+# Field extraction shared with the other scripts. The relative import is used when
+# this module is imported from the scripts package, the plain one when run directly
+try:
+    from ._projection import extract_prompt_fields
+except ImportError:
+    from _projection import extract_prompt_fields
+
+# orjson is optional; it parses large exports several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def iter_rows(data):
+    """
+    Yield the CSV row for each model
+    
+    Args:
+        data (list): Models from the OpenWebUI export
+    
+    Yields:
+        tuple: The name, description and system prompt of the model
+    """
+    for model in data:
+        name = model.get('name', '')
+        
+        # Extract description and system prompt from nested structure
+        description, system_prompt = extract_prompt_fields(model)
+        
+        yield (name, description, system_prompt)
+
 def convert_json_to_csv(input_file, output_file):
     """
     Convert JSON array to CSV with columns: name, description, system prompt
     
     Args:
         input_file (str): Path to the input JSON file
-        output_file (str): Path to the output CSV file
+        output_file (str): Path to the output CSV file; its directory must already exist
     """
     try:
         # Read the JSON file
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(input_file, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         # Check if data is a list
         if not isinstance(data, list):
             print(f"Error: Expected a JSON array, but got {type(data).__name__}")
             return False
         
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        
-        # Write to CSV
-        with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        # Write to CSV, with a large buffer so rows reach the disk in few writes
+        with open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
             writer = csv.writer(f)
             
             # Write header
             writer.writerow(['name', 'description', 'system_prompt'])
             
-            # Process each model in the array
-            for model in data:
-                name = model.get('name', '')
-                
-                # Extract description and system prompt from nested structure
-                description = ''
-                system_prompt = ''
-                
-                # Check if 'info' and 'meta' exist
-                if 'info' in model and isinstance(model['info'], dict):
-                    info = model['info']
-                    
-                    # Get description from meta if it exists
-                    if 'meta' in info and isinstance(info['meta'], dict):
-                        description = info['meta'].get('description', '')
-                    
-                    # Get system prompt from params if it exists
-                    if 'params' in info and isinstance(info['params'], dict):
-                        system_prompt = info['params'].get('system', '')
-                
-                # Write the row
-                writer.writerow([name, description, system_prompt])
+            # Write one row per model in the array
+            writer.writerows(iter_rows(data))
         
         print(f"Successfully converted {input_file} to {output_file}")
         return True
@@ -73,7 +85,8 @@ def main():
     # Define input and output paths
     workspace_dir = os.path.dirname(os.path.abspath(__file__))
     input_file = os.path.join(workspace_dir, "workspace", "input", "input.json")
-    output_file = os.path.join(workspace_dir, "workspace", "output", f"{timestamp}_models.csv")
+    output_dir = os.path.join(workspace_dir, "workspace", "output")
+    output_file = os.path.join(output_dir, f"{timestamp}_models.csv")
     
     # Check if input file exists
     if not os.path.isfile(input_file):
@@ -81,6 +94,9 @@ def main():
         print("Please place your JSON file as 'input.json' in the workspace/input directory")
         return 1
     
+    # Create output directory if it doesn't exist
+    os.makedirs(output_dir, exist_ok=True)
+    
     # Convert JSON to CSV
     if convert_json_to_csv(input_file, output_file):
         print(f"Conversion complete. Output saved to: {output_file}")
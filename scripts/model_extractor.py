@@ -14,8 +14,30 @@ import json
 import csv
 import os
 import sys
+import functools
+import itertools
 from datetime import datetime
 
+# Field extraction and JSON streaming shared with the other scripts; compiled with mypyc
+# when the extension has been built. The relative import is used when this module is
+# imported as scripts.model_extractor, the plain one when the script is run directly
+try:
+    from ._projection import project_model, should_stream, stream_array, write_json_entry
+except ImportError:
+    from _projection import project_model, should_stream, stream_array, write_json_entry
+
+# orjson is optional; it parses large exports several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size for the output files
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Separator between models in the text output
+_SEP = "-" * 50 + "\n\n"
+
 def create_output_directory():
     """
     Create a timestamped output directory in the format ddmmyy_hhmm
@@ -36,185 +58,121 @@ def create_output_directory():
     
     return output_dir
 
-def extract_model_data(input_file):
+def load_models(input_file):
     """
-    Extract model data from the input JSON file
+    Load the model array from the input JSON file
     
     Args:
         input_file (str): Path to the input JSON file
         
     Returns:
-        list: List of dictionaries containing model data
+        iterable: The models from the export, or None if the file could not be read
     """
     try:
+        # Stream very large exports so only one model is held in memory at a time
+        if should_stream(input_file):
+            return stream_array(input_file)
+        
         # Read the JSON file
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(input_file, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         # Check if data is a list
         if not isinstance(data, list):
             print(f"Error: Expected a JSON array, but got {type(data).__name__}")
             return None
         
-        # Extract the required fields for each model
-        models = []
-        skipped = 0
-        for model in data:
-            # Initialize system_prompt to check if it exists
-            system_prompt = ""
-            
-            # Extract system prompt from nested structure
-            if "info" in model and isinstance(model["info"], dict):
-                info = model["info"]
-                
-                # Get system prompt from params if it exists
-                if "params" in info and isinstance(info["params"], dict):
-                    system_prompt = info["params"].get("system", "")
-            
-            # Skip models without a system prompt
-            if not system_prompt:
-                skipped += 1
-                continue
-                
-            model_data = {
-                "name": model.get("name", "").strip(),
-                "description": "",
-                "system_prompt": system_prompt,
-                "link": f"openwebui://model/{model.get('id', '')}"
-            }
-            
-            # Extract description from nested structure
-            if "info" in model and isinstance(model["info"], dict):
-                info = model["info"]
-                
-                # Get description from meta if it exists
-                if "meta" in info and isinstance(info["meta"], dict):
-                    model_data["description"] = info["meta"].get("description", "")
-            
-            models.append(model_data)
-        
-        print(f"Successfully extracted data for {len(models)} models (skipped {skipped} models without system prompts)")
-        return models
+        return data
     
     except json.JSONDecodeError:
         print(f"Error: {input_file} is not a valid JSON file")
         return None
     except Exception as e:
-        print(f"Error extracting model data: {str(e)}")
+        print(f"Error reading model data: {str(e)}")
         return None
 
-def save_as_csv(models, output_file):
+def iter_models(data, stats):
     """
-    Save model data as CSV
+    Yield the extracted fields for each model that has a system prompt
     
     Args:
-        models (list): List of model data dictionaries
-        output_file (str): Path to the output CSV file
+        data (iterable): Models from the OpenWebUI export
+        stats (dict): Updated with the number of models skipped under "skipped"
+        
+    Yields:
+        Model: The model's name, description, system_prompt and link
     """
-    try:
-        with open(output_file, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            writer.writerow(['name', 'description', 'system_prompt', 'link'])
-            
-            # Write data rows
-            for model in models:
-                writer.writerow([
-                    model["name"],
-                    model["description"],
-                    model["system_prompt"],
-                    model["link"]
-                ])
+    stats["skipped"] = 0
+    for model in data:
+        model_data = project_model(model)
         
-        print(f"Successfully saved CSV to {output_file}")
-        return True
-    except Exception as e:
-        print(f"Error saving CSV: {str(e)}")
-        return False
+        # Skip models without a system prompt
+        if model_data is None:
+            stats["skipped"] += 1
+            continue
+        
+        yield model_data
 
-def save_as_simplified_json(models, output_file):
+def write_csv_row(writer, model):
     """
-    Save model data as simplified JSON
+    Write one model as a CSV row
     
     Args:
-        models (list): List of model data dictionaries
-        output_file (str): Path to the output JSON file
+        writer: csv.writer for the output CSV file
+        model (Model): Fields extracted from the model
     """
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(models, f, indent=2)
-        
-        print(f"Successfully saved simplified JSON to {output_file}")
-        return True
-    except Exception as e:
-        print(f"Error saving simplified JSON: {str(e)}")
-        return False
+    # Model is a tuple in CSV column order
+    writer.writerow(model)
 
-def save_as_markdown(models, output_file):
+def write_md_entry(f, model):
     """
-    Save model data as Markdown with model names as headers
+    Write one model as a Markdown section with the model name as header
     
     Args:
-        models (list): List of model data dictionaries
-        output_file (str): Path to the output Markdown file
+        f: Text file handle for the output Markdown file
+        model (Model): Fields extracted from the model
     """
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# OpenWebUI Models\n\n")
-            
-            for model in models:
-                # Write model name as header
-                f.write(f"## {model['name']}\n\n")
-                
-                # Write description
-                if model["description"]:
-                    f.write(f"{model['description']}\n\n")
-                
-                # Write link
-                f.write(f"**Link**: [{model['name']}]({model['link']})\n\n")
-                
-                # Add separator between models
-                f.write("---\n\n")
-        
-        print(f"Successfully saved Markdown to {output_file}")
-        return True
-    except Exception as e:
-        print(f"Error saving Markdown: {str(e)}")
-        return False
+    # Model name as header
+    parts = [f"## {model.name}\n\n"]
+    
+    # Description
+    if model.description:
+        parts.append(f"{model.description}\n\n")
+    
+    # Link, then a separator between models
+    parts.append(f"**Link**: [{model.name}]({model.link})\n\n---\n\n")
+    
+    f.write("".join(parts))
 
-def save_as_txt(models, output_file):
+@functools.lru_cache(maxsize=128)
+def _underline(length):
+    """Return an "=" underline of the given length for the text output"""
+    return "=" * length + "\n\n"
+
+def write_txt_entry(f, model):
     """
-    Save model data as plain text
+    Write one model as a plain text section
     
     Args:
-        models (list): List of model data dictionaries
-        output_file (str): Path to the output text file
+        f: Text file handle for the output text file
+        model (Model): Fields extracted from the model
     """
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("OPENWEBUI MODELS\n\n")
-            
-            for model in models:
-                # Write model name
-                f.write(f"{model['name']}\n")
-                f.write("=" * len(model['name']) + "\n\n")
-                
-                # Write description
-                if model["description"]:
-                    f.write(f"{model['description']}\n\n")
-                
-                # Write link
-                f.write(f"Link: {model['link']}\n\n")
-                
-                # Add separator between models
-                f.write("-" * 50 + "\n\n")
-        
-        print(f"Successfully saved text file to {output_file}")
-        return True
-    except Exception as e:
-        print(f"Error saving text file: {str(e)}")
-        return False
+    # Model name, underlined
+    parts = [f"{model.name}\n", _underline(len(model.name))]
+    
+    # Description
+    if model.description:
+        parts.append(f"{model.description}\n\n")
+    
+    # Link, then a separator between models
+    parts.append(f"Link: {model.link}\n\n")
+    parts.append(_SEP)
+    
+    f.write("".join(parts))
 
 def main():
     # Define input file path (hardcoded as per requirements)
@@ -227,27 +185,79 @@ def main():
         print("Please place your JSON file as 'input.json' in the input directory")
         return 1
     
-    # Create timestamped output directory
-    output_dir = create_output_directory()
+    # Read model data
+    data = load_models(input_file)
+    if data is None:
+        return 1
     
-    # Extract model data
-    models = extract_model_data(input_file)
-    if not models:
+    # Find the first model with a system prompt before creating any output, so a run
+    # with nothing to export does not leave empty files behind
+    stats = {}
+    models = iter_models(data, stats)
+    try:
+        first = next(models, None)
+    except Exception as e:
+        print(f"Error reading model data: {str(e)}")
         return 1
     
-    # Save data in different formats
-    success = True
-    success &= save_as_csv(models, os.path.join(output_dir, "models.csv"))
-    success &= save_as_simplified_json(models, os.path.join(output_dir, "models.json"))
-    success &= save_as_markdown(models, os.path.join(output_dir, "models.md"))
-    success &= save_as_txt(models, os.path.join(output_dir, "models.txt"))
-    
-    if success:
-        print(f"\nConversion complete. All output files saved to: {output_dir}")
-        return 0
-    else:
+    if first is None:
+        print(f"No models with system prompts found (skipped {stats['skipped']} models)")
+        return 1
+    
+    # Create timestamped output directory
+    output_dir = create_output_directory()
+    csv_path = os.path.join(output_dir, "models.csv")
+    json_path = os.path.join(output_dir, "models.json")
+    md_path = os.path.join(output_dir, "models.md")
+    txt_path = os.path.join(output_dir, "models.txt")
+    
+    # Write all four formats in a single pass over the models, with large
+    # buffers so the many small entries reach the disk in few writes
+    count = 0
+    try:
+        with open(csv_path, 'w', encoding='utf-8', newline='', buffering=OUTPUT_BUFFER_SIZE) as cf, \
+             open(json_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as jf, \
+             open(md_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as mf, \
+             open(txt_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as tf:
+            writer = csv.writer(cf)
+            
+            # Write headers
+            writer.writerow(['name', 'description', 'system_prompt', 'link'])
+            jf.write(b"[")
+            mf.write("# OpenWebUI Models\n\n")
+            tf.write("OPENWEBUI MODELS\n\n")
+            
+            for model in itertools.chain([first], models):
+                write_csv_row(writer, model)
+                write_json_entry(jf, model._asdict(), count == 0)
+                write_md_entry(mf, model)
+                write_txt_entry(tf, model)
+                count += 1
+            
+            # Close the JSON array
+            jf.write(b"\n]")
+    except Exception as e:
+        print(f"Error writing output files: {str(e)}")
+        
+        # Remove the partial output files, and the output directory if nothing else is in it
+        for path in (csv_path, json_path, md_path, txt_path):
+            if os.path.exists(path):
+                os.remove(path)
+        try:
+            os.rmdir(output_dir)
+        except OSError:
+            pass
+        
         print("\nConversion completed with errors. Check the logs above.")
         return 1
+    
+    print(f"Successfully extracted data for {count} models (skipped {stats['skipped']} models without system prompts)")
+    print(f"Successfully saved CSV to {csv_path}")
+    print(f"Successfully saved simplified JSON to {json_path}")
+    print(f"Successfully saved Markdown to {md_path}")
+    print(f"Successfully saved text file to {txt_path}")
+    print(f"\nConversion complete. All output files saved to: {output_dir}")
+    return 0
 
 if __name__ == "__main__":
     sys.exit(main())
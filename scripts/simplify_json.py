@@ -1,83 +1,104 @@
 #!/usr/bin/env python3
 """
 Script to simplify JSON data by extracting only the name, system prompt, and description fields.
+
+The simplify_json() function can also be used from other code without the command-line
+interface (argparse is only loaded by main()):
+
+    from scripts.simplify_json import simplify_json
+    simplify_json("input.json", "output/simplified.json", filter_personal=True)
 """
 
 import json
-import argparse
 import os
+import re
 from datetime import datetime
 
+# Field extraction and JSON streaming shared with the other scripts. The relative
+# import is used when this module is imported from the scripts package, the plain
+# one when run directly
+try:
+    from ._projection import extract_prompt_fields, should_stream, stream_array, write_json_entry
+except ImportError:
+    from _projection import extract_prompt_fields, should_stream, stream_array, write_json_entry
+
+# orjson is optional; it parses large exports several times faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Terms that mark an entry as containing personal information
+_PERSONAL_RE = re.compile(r'daniel|rosehill', re.IGNORECASE)
+
 def simplify_json(input_file, output_file, filter_personal=True):
     """
     Extract only the name, system prompt, and description from each item in a JSON array.
     
     Args:
         input_file (str): Path to the input JSON file
-        output_file (str): Path to the output JSON file
+        output_file (str): Path to the output JSON file; its directory must already exist
         filter_personal (bool): Whether to filter out entries with personal information
     
     Returns:
         bool: True if successful, False otherwise
     """
+    # The output is written to a temporary file next to it and moved into place once
+    # complete, so an error part way through never leaves a truncated JSON file
+    temp_file = output_file + ".part"
+    
     try:
-        # Read the input JSON file
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        if not isinstance(data, list):
-            print(f"Error: Expected a JSON array, but got {type(data).__name__}")
-            return False
-        
-        # Personal terms to filter out if filter_personal is True
-        personal_terms = ["Daniel", "Rosehill", "daniel", "rosehill"]
+        # Stream very large exports so only one item is held in memory at a time
+        if should_stream(input_file):
+            data = stream_array(input_file)
+            if data is None:
+                return False
+        else:
+            # Read the input JSON file
+            if orjson is not None:
+                with open(input_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(input_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            
+            if not isinstance(data, list):
+                print(f"Error: Expected a JSON array, but got {type(data).__name__}")
+                return False
         
-        # Simplify each item in the array
-        simplified_data = []
+        # Simplify each item and write it straight to the output file, so only one
+        # serialized item is held in memory at a time
+        count = 0
         skipped = 0
         
-        for i, item in enumerate(data):
-            # Check if we should skip this item due to personal information
-            if filter_personal and contains_personal_info(item, personal_terms):
-                skipped += 1
-                print(f"Skipped item {i+1} (contains personal info)")
-                continue
+        with open(temp_file, 'wb', buffering=1 << 20) as f:
+            f.write(b"[")
             
-            # Extract the required fields
-            simplified_item = {
-                "name": item.get("name", "")
-            }
-            
-            # Extract description and system prompt from nested structure
-            if "info" in item and isinstance(item["info"], dict):
-                info = item["info"]
+            for item in data:
+                # Check if we should skip this item due to personal information
+                if filter_personal and contains_personal_info(item):
+                    skipped += 1
+                    continue
                 
-                # Get system prompt from params if it exists
-                if "params" in info and isinstance(info["params"], dict):
-                    simplified_item["system_prompt"] = info["params"].get("system", "")
-                else:
-                    simplified_item["system_prompt"] = ""
+                # Extract the required fields
+                simplified_item = {
+                    "name": item.get("name", "")
+                }
                 
-                # Get description from meta if it exists
-                if "meta" in info and isinstance(info["meta"], dict):
-                    simplified_item["description"] = info["meta"].get("description", "")
-                else:
-                    simplified_item["description"] = ""
-            else:
-                simplified_item["system_prompt"] = ""
-                simplified_item["description"] = ""
+                # Extract description and system prompt from nested structure
+                description, system_prompt = extract_prompt_fields(item)
+                simplified_item["system_prompt"] = system_prompt
+                simplified_item["description"] = description
+                
+                write_json_entry(f, simplified_item, count == 0)
+                count += 1
             
-            simplified_data.append(simplified_item)
-            print(f"Simplified item {i+1}")
-        
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+            # Close the JSON array
+            f.write(b"\n]" if count else b"]")
         
-        # Write simplified data to output file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(simplified_data, f, indent=2)
+        os.replace(temp_file, output_file)
         
-        print(f"Successfully simplified {len(simplified_data)} items to {output_file}")
+        print(f"Successfully simplified {count} items to {output_file}")
         if filter_personal:
             print(f"Skipped {skipped} items containing personal information")
         
@@ -86,42 +107,37 @@ def simplify_json(input_file, output_file, filter_personal=True):
     except Exception as e:
         print(f"Error: {str(e)}")
         return False
+    finally:
+        # Remove the partial output if the conversion did not complete
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
 
-def contains_personal_info(obj, personal_terms):
+def contains_personal_info(obj):
     """
     Check if an object contains personal information.
     
     Args:
         obj: The object to check
-        personal_terms: List of personal terms to filter out
     
     Returns:
         True if personal info is found, False otherwise
     """
-    if isinstance(obj, dict):
-        # Check all values in the dictionary
-        for key, value in obj.items():
-            if isinstance(value, (dict, list)):
-                if contains_personal_info(value, personal_terms):
-                    return True
-            elif isinstance(value, str):
-                for term in personal_terms:
-                    if term in value:
-                        return True
-    elif isinstance(obj, list):
-        # Check all items in the list
-        for item in obj:
-            if contains_personal_info(item, personal_terms):
-                return True
-    elif isinstance(obj, str):
-        # Check if the string contains any personal terms
-        for term in personal_terms:
-            if term in obj:
-                return True
+    # Walk nested dicts and lists with an explicit stack instead of recursion
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str) and _PERSONAL_RE.search(value):
+            return True
     
     return False
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Simplify JSON data by extracting only name, system prompt, and description')
     parser.add_argument('--input', '-i', default='workspace/input/input.json', 
                         help='Path to input JSON file')
@@ -139,6 +155,11 @@ def main():
         timestamp = datetime.now().strftime("%y%m%d_%H%M%S")
         args.output = f"workspace/output/simplified_data_{timestamp}.json"
     
+    # Create output directory if it doesn't exist
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    
     # Simplify JSON
     simplify_json(args.input, args.output, args.filter)
 